@@ -15,7 +15,10 @@ Description :
             output to the controlling terminal (when available) and a color-free
             record to the specified log file.
         - ANSI escape sequences are removed from the file output using a
-            conservative regex; lines are flushed immediately to keep logs live.
+            conservative regex; lines are flushed immediately to keep logs live,
+            unless a `capacity` greater than 1 is given, in which case the file
+            uses a 64 KiB buffer and is flushed every `capacity` writes and on
+            `flush()`/`close()`.
         - Provides minimal API: `write()`, `flush()` and `close()` so it can be
             used as a drop-in replacement for `sys.stdout`.
 
@@ -43,6 +46,9 @@ import sys  # For replacing stdout/stderr
 # Regex Constants:
 ANSI_ESCAPE_REGEX = re.compile(r"\x1B\[[0-9;]*[a-zA-Z]")  # Pattern to remove ANSI colors
 
+# File Constants:
+BATCHED_FILE_BUFFER_SIZE = 65536  # Log file buffer size in bytes when writes are batched (capacity > 1)
+
 # Classes Definitions:
 
 
@@ -57,15 +63,17 @@ class Logger:
 
     :param logfile_path: Path to the log file.
     :param clean: If True, truncate the log file on init; otherwise append.
+    :param capacity: Number of writes buffered before the log file is flushed.
     """
 
-    def __init__(self, logfile_path, clean=False):
+    def __init__(self, logfile_path, clean=False, capacity=1):
         """
         Initialize the Logger.
 
         :param self: Instance of the Logger class.
         :param logfile_path: Path to the log file.
         :param clean: If True, truncate the log file on init; otherwise append.
+        :param capacity: Number of writes buffered before the log file is flushed (1 flushes every write).
         """
 
         self.logfile_path = logfile_path  # Store log file path
@@ -74,9 +82,13 @@ class Logger:
         if parent and not os.path.exists(parent):  # Create parent directories if needed
             os.makedirs(parent, exist_ok=True)  # Safe creation
 
+        self.capacity = max(1, int(capacity))  # Writes buffered before flushing the log file
+        buffering = BATCHED_FILE_BUFFER_SIZE if self.capacity > 1 else -1  # Larger buffer only when batching writes
+
         mode = "w" if clean else "a"  # Choose file mode based on 'clean' flag
-        self.logfile = open(logfile_path, mode, encoding="utf-8")  # Open log file
+        self.logfile = open(logfile_path, mode, buffering=buffering, encoding="utf-8")  # Open log file
         self.is_tty = sys.stdout.isatty()  # Verify if stdout is a TTY
+        self.pending = 0  # Writes not yet flushed to the log file
 
     def write(self, message):
         """
@@ -97,7 +109,10 @@ class Logger:
 
         try:  # Write to log file
             self.logfile.write(clean_out)  # Write cleaned message
-            self.logfile.flush()  # Ensure immediate write
+            self.pending += 1  # Count the buffered write
+            if self.pending >= self.capacity:  # Buffer is full
+                self.logfile.flush()  # Write the buffered messages
+                self.pending = 0  # Reset the buffered writes counter
         except Exception:  # Fail silently to avoid breaking user code
             pass  # Silent fail
 
@@ -121,6 +136,7 @@ class Logger:
 
         try:  # Flush log file buffer
             self.logfile.flush()  # Flush log file
+            self.pending = 0  # Reset the buffered writes counter
         except Exception:  # Fail silently
             pass  # Silent fail
 
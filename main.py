@@ -12,6 +12,9 @@ Description :
     Key features include:
         - Scraping proxies from spys.me using regex pattern matching
         - Scraping proxies from free-proxy-list.net using HTML parsing
+        - Fetching all proxy sources concurrently with a thread pool
+        - Reusing HTTP connections through a shared session with retries
+        - Revalidating unchanged pages with ETag/Last-Modified conditional requests
         - Saving all collected proxies to a single output file
         - Logging output to both terminal and file
         - Execution time calculation and reporting
@@ -21,6 +24,8 @@ Usage:
     1. Ensure all dependencies are installed (see Dependencies section).
     2. Run the script via Python:
             $ python main.py
+       Use --force to ignore the HTTP cache and download every source again:
+            $ python main.py --force
     3. The script will scrape proxies and save them to separate files in the Proxies_List directory.
 
 Outputs:
@@ -29,18 +34,20 @@ Outputs:
     - Proxies_List/ssl_proxies_proxies.txt: Proxies from sslproxies.org
     - Proxies_List/us_proxy_proxies.txt: Proxies from us-proxy.org
     - Proxies_List/socks_proxy_proxies.txt: Proxies from socks-proxy.net
+    - Proxies_List/.http_cache.json: ETag/Last-Modified cache used for conditional requests
     - PROXIES.md: Markdown file with formatted proxy list (updated automatically)
 
 TODOs:
-    - Implement proxy validation and filtering
-    - Add command-line arguments for customization
+    - Implement proxy liveness validation and filtering
+    - Add command-line arguments for selecting sources and the output directory
     - Add proxy response time testing
 
 Dependencies:
     - Python >= 3.6
-    - beautifulsoup4
+    - brotli
     - colorama
     - Logger (custom module)
+    - lxml
     - requests
 
 Assumptions & Notes:
@@ -50,17 +57,26 @@ Assumptions & Notes:
     - Sound notification is disabled on Windows
 """
 
-import atexit  # For playing a sound when the program finishes
+import argparse  # For parsing command-line arguments
+import atexit  # For flushing the buffered log file when the program finishes
 import datetime  # For getting the current date and time
+import json  # For persisting the HTTP cache
 import os  # For running a command in the terminal
 import platform  # For getting the operating system name
 import re  # For regular expressions
+import socket  # For validating and packing IPv4 addresses
 import requests  # For making HTTP requests
+import subprocess  # For playing the sound without spawning a shell
 import sys  # For system-specific parameters and functions
-from bs4 import BeautifulSoup  # For HTML parsing
+import time  # For expiring the in-process scrape cache and measuring the execution time
 from colorama import Style  # For coloring the terminal
+from concurrent.futures import ThreadPoolExecutor, as_completed  # For scraping the proxy sources concurrently
 from Logger import Logger  # For logging output to both terminal and file
+from lxml import etree, html  # For parsing HTML pages and compiling XPath expressions
 from pathlib import Path  # For handling file paths
+from requests.adapters import HTTPAdapter  # For connection pooling and retries on the HTTP session
+from requests.utils import DEFAULT_ACCEPT_ENCODING  # For advertising every content encoding urllib3 can decode
+from urllib3.util.retry import Retry  # For the retry strategy of the HTTP adapter
 
 
 # Macros:
@@ -78,23 +94,65 @@ class BackgroundColors:  # Colors for the terminal
 VERBOSE = False  # Set to True to output verbose messages
 
 # Proxy Constants:
-PROXY_SOURCES = {
+PROXY_SOURCES = {  # Declared in alphabetical key order; keep new sources sorted
     "free_proxy_list": "https://free-proxy-list.net/",
     "socks_proxy": "https://www.socks-proxy.net/",
     "spys_me": "https://spys.me/proxy.txt",
     "ssl_proxies": "https://www.sslproxies.org/",
     "us_proxy": "https://www.us-proxy.org/",
 }
-PROXY_SOURCES = dict(sorted(PROXY_SOURCES.items()))  # Sort the dictionary by keys
-PROXY_REGEX = r"[0-9]+(?:\.[0-9]+){3}:[0-9]+"  # Regex pattern to match IP:PORT format
+FREE_PROXY_LIST_ROWS_XPATH = etree.XPath(
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' fpl-list ')]"
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' table ')]"
+    "//tbody//tr"
+)  # Precompiled XPath returning the rows of the free-proxy-list.net table (same as ".fpl-list .table tbody tr")
+TABLE_ROWS_XPATH = etree.XPath("//table//tbody//tr")  # Precompiled XPath returning the rows of any HTML table (same as "table tbody tr")
+PROXY_REGEX = re.compile(
+    rb"(?<![0-9.])[0-9]{1,3}(?:\.[0-9]{1,3}){3}:[0-9]{1,5}(?![0-9])", re.MULTILINE
+)  # Precompiled bytes pattern to match IP:PORT format (bounded quantifiers keep backtracking constant per position)
 OUTPUT_DIR = "Proxies_List"  # Output directory for proxy files
+OUTPUT_DIR_PATH = Path(OUTPUT_DIR)  # Output directory as a Path, built once for every proxy file
 OUTPUT_FILE_SUFFIX = "proxies.txt"  # Suffix for proxy output files
 MARKDOWN_FILENAME = "PROXIES.md"  # Markdown output filename
+HTTP_CACHE_FILE = os.path.join(OUTPUT_DIR, ".http_cache.json")  # ETag/Last-Modified validators and proxies per URL
+SCRAPE_CACHE_TTL = 60  # Seconds during which a scraped URL is reused from memory instead of being requested again
+SCRAPE_CACHE = {}  # In-process cache mapping URLs to (monotonic timestamp, proxies) tuples
+
+# HTTP Constants:
+REQUEST_TIMEOUT = (3, 10)  # (connect, read) timeout in seconds for each request
+REQUEST_HEADERS = {
+    "Accept": "text/html,text/plain;q=0.9,*/*;q=0.8",
+    "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+}  # Default headers sent with every request (HTML/text only, compressed bodies (brotli when installed) and a realistic browser User-Agent)
+REQUEST_RETRIES = 3  # Number of retries for failed connections
+REQUEST_BACKOFF_FACTOR = 0.3  # Backoff factor between retries (0.3s, 0.6s, 1.2s, ...)
+REQUEST_RETRY_STATUSES = (502, 503, 504)  # Transient gateway/server statuses that are retried
+MAX_CONCURRENT_REQUESTS = 16  # Upper bound of simultaneous requests, so adding sources does not spawn unbounded threads
+STREAM_CHUNK_SIZE = 65536  # Size in bytes of each chunk read from streamed responses
+
+# HTTP Session Setup:
+SESSION = requests.Session()  # Shared session to reuse TCP/TLS connections (keep-alive) across requests
+SESSION.headers.update(REQUEST_HEADERS)  # Apply the default headers to every request of the session
+HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=len(PROXY_SOURCES),
+    pool_maxsize=MAX_CONCURRENT_REQUESTS,
+    max_retries=Retry(
+        total=REQUEST_RETRIES,
+        backoff_factor=REQUEST_BACKOFF_FACTOR,
+        status_forcelist=REQUEST_RETRY_STATUSES,
+        raise_on_status=False,
+    ),
+)  # One connection pool per source host, each able to serve every concurrent worker
+SESSION.mount("https://", HTTP_ADAPTER)  # Use the pooled adapter for HTTPS sources
+SESSION.mount("http://", HTTP_ADAPTER)  # Use the pooled adapter for HTTP sources
 
 # Logger Setup:
-logger = Logger(f"./Logs/{Path(__file__).stem}.log", clean=True)  # Create a Logger instance
+LOG_BUFFER_CAPACITY = 1024  # Number of writes buffered before the log file is flushed
+logger = Logger(f"./Logs/{Path(__file__).stem}.log", clean=True, capacity=LOG_BUFFER_CAPACITY)  # Create a Logger instance
 sys.stdout = logger  # Redirect stdout to the logger
 sys.stderr = logger  # Redirect stderr to the logger
+atexit.register(logger.flush)  # Flush the buffered log file when the program finishes
 
 # Sound Constants:
 SOUND_COMMANDS = {
@@ -103,6 +161,23 @@ SOUND_COMMANDS = {
     "Windows": "start",
 }  # The commands to play a sound for each operating system
 SOUND_FILE = "./.assets/Sounds/NotificationSound.wav"  # The path to the sound file
+CURRENT_OS = platform.system()  # The current operating system (invariant for the whole run)
+SOUND_COMMAND = SOUND_COMMANDS.get(CURRENT_OS)  # The command to play a sound on the current operating system
+SOUND_FILE_EXISTS = os.path.isfile(SOUND_FILE)  # Whether the sound file exists (checked once at import)
+
+# Message Templates:
+WELCOME_MESSAGE = f"{BackgroundColors.CLEAR_TERMINAL}{BackgroundColors.BOLD}{BackgroundColors.GREEN}Welcome to the {BackgroundColors.CYAN}Proxy List Generator{BackgroundColors.GREEN} program!{Style.RESET_ALL}"  # Welcome message
+NO_PROXIES_MESSAGE = f"{BackgroundColors.YELLOW}No proxies were scraped from any source. Skipping markdown file creation.{Style.RESET_ALL}"  # Warning when every source is empty
+EXECUTION_TIMES_TEMPLATE = f"{BackgroundColors.GREEN}Start time: {BackgroundColors.CYAN}{{start}}\n{BackgroundColors.GREEN}Finish time: {BackgroundColors.CYAN}{{finish}}\n{BackgroundColors.GREEN}Execution time: {BackgroundColors.CYAN}{{elapsed}}{Style.RESET_ALL}"  # Start, finish and execution times (filled with str.format)
+SCRAPING_TEMPLATE = f"{BackgroundColors.GREEN}Scraping proxies from {{url}}...{Style.RESET_ALL}"  # Per-source fetch start
+FETCH_FAILED_TEMPLATE = f"{BackgroundColors.RED}Failed to fetch {{url}}: {BackgroundColors.CYAN}{{error}}{Style.RESET_ALL}"  # Per-source network error
+BAD_STATUS_TEMPLATE = f"{BackgroundColors.YELLOW}Received status {{status}} from {BackgroundColors.CYAN}{{url}}{Style.RESET_ALL}"  # Per-source HTTP error
+NOT_MODIFIED_TEMPLATE = f"{BackgroundColors.GREEN}Not modified, reusing {{count}} cached proxies from {{url}}{Style.RESET_ALL}"  # Per-source cache hit
+PARSE_FAILED_TEMPLATE = f"{BackgroundColors.RED}Failed to parse {{url}}: {BackgroundColors.CYAN}{{error}}{Style.RESET_ALL}"  # Per-source parsing error
+SCRAPED_TEMPLATE = f"{BackgroundColors.GREEN}Scraped {{count}} proxies from {{url}}{Style.RESET_ALL}"  # Per-source scraping result
+WROTE_TEMPLATE = f"{BackgroundColors.GREEN}Wrote {{count}} proxies to {{filepath}}{Style.RESET_ALL}"  # Per-source file write
+WRITE_FAILED_TEMPLATE = f"{BackgroundColors.RED}Failed to write the {BackgroundColors.CYAN}{{source}}{BackgroundColors.RED} proxy file: {BackgroundColors.CYAN}{{error}}{Style.RESET_ALL}"  # Per-source file write error
+PROGRAM_FINISHED_MESSAGE = f"\n{BackgroundColors.BOLD}{BackgroundColors.GREEN}Program finished.{Style.RESET_ALL}"  # End of the program message
 
 # RUN_FUNCTIONS:
 RUN_FUNCTIONS = {
@@ -127,80 +202,47 @@ def verbose_output(true_string="", false_string=""):
         print(false_string)  # Output the false statement string
 
 
-def verify_filepath_exists(filepath):
+def extract_proxies_from_spys_me(chunks):
     """
-    Verify if a file or folder exists at the specified path.
+    Extracts proxy IP addresses and ports from the spys.me plain-text body
+    using regex pattern matching.
 
-    :param filepath: Path to the file or folder
-    :return: True if the file or folder exists, False otherwise
-    """
-
-    verbose_output(
-        f"{BackgroundColors.GREEN}Verifying if the file or folder exists at the path: {BackgroundColors.CYAN}{filepath}{Style.RESET_ALL}"
-    )  # Output the verbose message
-
-    return os.path.exists(filepath)  # Return True if the file or folder exists, False otherwise
-
-
-def scrape_proxies_from_spys_me():
-    """
-    Scrapes proxy IP addresses and ports from spys.me using regex pattern matching
-    and returns a list of proxy strings.
+    The body is scanned chunk by chunk while it is being received, so the
+    whole response is never buffered, and the raw bytes are matched directly
+    so only the matched IP:PORT substrings are ever decoded. A match never spans a line break, so
+    each chunk is scanned up to its last complete line and the remainder is
+    carried over to the next chunk.
 
+    :param chunks: Iterable of byte chunks of the spys.me body (e.g. response.iter_content())
     :return: List of proxy strings in IP:PORT format
     """
 
-    verbose_output(
-        f"{BackgroundColors.GREEN}Scraping proxies from spys.me...{Style.RESET_ALL}"
-    )  # Output the scraping message
-    
-    c = requests.get(PROXY_SOURCES["spys_me"])  # Make HTTP request to spys.me
-    
-    test_str = c.text  # Get the response text
-    
-    a = re.finditer(PROXY_REGEX, test_str, re.MULTILINE)  # Find all matches of IP:PORT pattern
+    proxies = []  # Accumulate extracted proxy strings
+    tail = b""  # Incomplete last line of the previous chunk
     
-    proxies = [i.group() for i in a]  # Collect all proxy strings
+    for chunk in chunks:  # Iterate over the body as it is received
+        data = tail + chunk  # Prepend the carried-over line
+        cut = data.rfind(b"\n") + 1  # End of the last complete line in this chunk
+        proxies.extend(match.decode("ascii") for match in PROXY_REGEX.findall(data, 0, cut))  # Decode only the matches
+        tail = data[cut:]  # Carry the incomplete line over to the next chunk
     
-    verbose_output(
-        f"{BackgroundColors.GREEN}Scraped {len(proxies)} proxies from spys.me{Style.RESET_ALL}"
-    )  # Output the scraping result
+    proxies.extend(match.decode("ascii") for match in PROXY_REGEX.findall(tail))  # Scan the last line when the body has no trailing newline
     
     return proxies  # Return the list of proxies
 
 
-def scrape_proxies_from_free_proxy_list():
+def extract_proxies_from_free_proxy_list(html_content):
     """
-    Scrapes proxy IP addresses and ports from free-proxy-list.net using HTML parsing
-    and returns a list of proxy strings.
+    Extracts proxy IP addresses and ports from the free-proxy-list.net HTML body
+    using a precompiled XPath that selects the rows of its proxy table.
 
+    :param html_content: HTML content as bytes or string
     :return: List of proxy strings in IP:PORT format
     """
 
-    verbose_output(
-        f"{BackgroundColors.GREEN}Scraping proxies from free-proxy-list.net...{Style.RESET_ALL}"
-    )  # Output the scraping message
-    
-    d = requests.get(PROXY_SOURCES["free_proxy_list"])  # Make HTTP request to free-proxy-list.net
-    
-    soup = BeautifulSoup(d.content, "html.parser")  # Parse the HTML content
-    
-    td_elements = soup.select(".fpl-list .table tbody tr td")  # Select table data elements
-    
-    ips = []  # List to store IP addresses
-    ports = []  # List to store ports
-    
-    for j in range(0, len(td_elements), 8):  # Iterate over elements in steps of 8
-        ips.append(td_elements[j].text.strip())  # Extract and store IP
-        ports.append(td_elements[j + 1].text.strip())  # Extract and store port
-    
-    proxies = [f"{ip}:{port}" for ip, port in zip(ips, ports)]  # Format proxy strings
-    
-    verbose_output(
-        f"{BackgroundColors.GREEN}Scraped {len(proxies)} proxies from free-proxy-list.net{Style.RESET_ALL}"
-    )  # Output the scraping result
+    tree = html.fromstring(html_content)  # Parse the HTML content with the C-based lxml parser
     
-    return proxies  # Return the list of proxies
+    return extract_proxies_from_rows(FREE_PROXY_LIST_ROWS_XPATH(tree))  # Extract IP and port from each table row
 
 
 def validate_proxy_source_url(url_name):
@@ -214,121 +256,387 @@ def validate_proxy_source_url(url_name):
     url = PROXY_SOURCES.get(url_name)  # Get the URL for the specified source from the PROXY_SOURCES dictionary
     
     if not url:  # Missing configuration for this source
-        verbose_output(
-            f"{BackgroundColors.RED}No URL configured for source: {BackgroundColors.CYAN}{url_name}{Style.RESET_ALL}"
-        )  # Output error message
+        if VERBOSE:  # Only build the message when verbose output is enabled
+            print(
+                f"{BackgroundColors.RED}No URL configured for source: {BackgroundColors.CYAN}{url_name}{Style.RESET_ALL}"
+            )  # Output error message
         return None  # Return None when no URL is configured
     
     return url  # Return the valid URL
 
 
-def fetch_proxy_page(url):
+def fetch_proxy_page(url, headers=None):
     """
-    Fetches the HTML content from a proxy source URL with timeout and error handling.
+    Fetches the HTML content from a proxy source URL with timeout and error handling,
+    using the shared HTTP session so connections are kept alive and reused.
 
     :param url: The URL to fetch
-    :return: Response object if successful, None otherwise
+    :param headers: Optional extra headers for this request (e.g. conditional request validators)
+    :return: Streamed response object if successful (200) or not modified (304), None otherwise
     """
 
-    verbose_output(
-        f"{BackgroundColors.GREEN}Scraping proxies from {url}...{Style.RESET_ALL}"
-    )  # Output the scraping message
+    if VERBOSE:  # Only build the message when verbose output is enabled
+        print(SCRAPING_TEMPLATE.format(url=url))  # Output the scraping message
 
     try:  # Attempt to fetch the page with a timeout to avoid hanging indefinitely
-        r = requests.get(url, timeout=10)  # 10-second timeout for the request
+        r = SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True)  # Reuse pooled connections, the body is read later by the parser
     except Exception as exc:  # Network/requests error (DNS, timeout, connection, etc.)
-        verbose_output(
-            f"{BackgroundColors.RED}Failed to fetch {url}: {BackgroundColors.CYAN}{exc}{Style.RESET_ALL}"
-        )  # Output error message
+        if VERBOSE:  # Only build the message when verbose output is enabled
+            print(FETCH_FAILED_TEMPLATE.format(url=url, error=exc))  # Output error message
         return None  # Return None on request failure
 
-    if r.status_code != 200:  # Non-successful HTTP response
-        verbose_output(
-            f"{BackgroundColors.YELLOW}Received status {r.status_code} from {BackgroundColors.CYAN}{url}{Style.RESET_ALL}"
-        )  # Output warning message
+    if r.status_code not in (200, 304):  # Non-successful HTTP response
+        if VERBOSE:  # Only build the message when verbose output is enabled
+            print(BAD_STATUS_TEMPLATE.format(status=r.status_code, url=url))  # Output warning message
+        r.close()  # Release the unread streamed connection
         return None  # Return None on bad HTTP status
 
     return r  # Return the response object
 
 
-def extract_proxies_from_table(html_content):
+def extract_proxies_from_rows(rows):
     """
-    Extracts proxy IP:PORT pairs from HTML table rows.
+    Extracts proxy IP:PORT pairs from HTML table rows, reading only the
+    first two cells (IP and port) of each row.
 
-    :param html_content: HTML content as bytes or string
+    Iterating rows and picking columns by index does not depend on the
+    number of columns of the table, unlike walking a flat list of cells.
+
+    :param rows: Iterable of lxml <tr> elements
     :return: List of proxy strings in IP:PORT format
     """
 
-    soup = BeautifulSoup(html_content, "html.parser")  # Parse the HTML content of the page
-    rows = soup.select("table tbody tr")  # Common table row selector across sources
-
     proxies = []  # Accumulate extracted proxy strings
     for row in rows:  # Iterate over each table row to extract IP and port
-        cols = row.find_all("td")  # Table columns in this row
+        cols = row.findall("td")  # Table columns in this row
         if len(cols) >= 2:  # Expect at least IP and Port columns
-            ip = cols[0].text.strip()  # First column: IP address
-            port = cols[1].text.strip()  # Second column: Port number
+            ip = cols[0].text_content().strip()  # First column: IP address
+            port = cols[1].text_content().strip()  # Second column: Port number
             if ip and port:  # Basic sanity check
                 proxies.append(f"{ip}:{port}")  # Format and store the proxy string
 
     return proxies  # Return the list of extracted proxies
 
 
-def scrape_proxies_from_table_site(url_name):
+def extract_proxies_from_table(html_content):
+    """
+    Extracts proxy IP:PORT pairs from HTML table rows.
+
+    :param html_content: HTML content as bytes or string
+    :return: List of proxy strings in IP:PORT format
+    """
+
+    tree = html.fromstring(html_content)  # Parse the HTML content of the page with the C-based lxml parser
+
+    return extract_proxies_from_rows(TABLE_ROWS_XPATH(tree))  # Extract IP and port from each table row
+
+
+def load_http_cache():
+    """
+    Loads the HTTP cache that stores, per URL, the ETag/Last-Modified validators
+    of the last successful response and the proxies parsed from it.
+
+    :return: Dictionary mapping URLs to valid cache entries (empty if missing or unreadable)
+    """
+
+    try:  # Attempt to read and decode the cache file
+        with open(HTTP_CACHE_FILE, "r", encoding="utf-8") as cache_file:  # Open the cache file in read mode
+            http_cache = json.load(cache_file)  # Decode the JSON content
+    except FileNotFoundError:  # No cache was saved yet
+        return {}  # Start with an empty cache
+    except (OSError, ValueError) as exc:  # Unreadable or corrupted cache file
+        verbose_output(
+            f"{BackgroundColors.YELLOW}Ignoring unreadable HTTP cache {BackgroundColors.CYAN}{HTTP_CACHE_FILE}{BackgroundColors.YELLOW}: {exc}{Style.RESET_ALL}"
+        )  # Output warning message
+        return {}  # Fall back to an empty cache
+
+    if not isinstance(http_cache, dict):  # Only accept the expected top-level structure
+        return {}  # Fall back to an empty cache
+
+    return {
+        url: entry
+        for url, entry in http_cache.items()
+        if isinstance(entry, dict) and isinstance(entry.get("proxies"), list)
+    }  # Drop malformed entries so their URLs are simply fetched again
+
+
+def save_http_cache(http_cache):
+    """
+    Saves the HTTP cache to disk so the next run can issue conditional requests.
+
+    :param http_cache: Dictionary mapping URLs to cache entries
+    :return: None
+    """
+
+    create_directory(os.path.dirname(HTTP_CACHE_FILE))  # Ensure the cache directory exists
+
+    with open(HTTP_CACHE_FILE, "w", encoding="utf-8") as cache_file:  # Open the cache file in write mode
+        json.dump(http_cache, cache_file)  # Encode the cache as JSON
+
+    verbose_output(
+        f"{BackgroundColors.GREEN}Saved HTTP cache with {len(http_cache)} entries to {BackgroundColors.CYAN}{HTTP_CACHE_FILE}{Style.RESET_ALL}"
+    )  # Output the cache save message
+
+
+def build_conditional_headers(cache_entry):
     """
-    Generic scraper for sites that expose proxies in an HTML table.
+    Builds the conditional request headers for a cached URL.
+
+    :param cache_entry: Cache entry of the URL (or None when not cached)
+    :return: Dictionary with If-None-Match/If-Modified-Since headers (empty if nothing to revalidate)
+    """
+
+    headers = {}  # Conditional request headers
+
+    if not cache_entry:  # Nothing cached for this URL
+        return headers  # Issue a regular request
+
+    if cache_entry.get("etag"):  # Strong or weak entity tag from the last response
+        headers["If-None-Match"] = cache_entry["etag"]  # Ask the server to answer 304 if unchanged
+    if cache_entry.get("last_modified"):  # Last modification date from the last response
+        headers["If-Modified-Since"] = cache_entry["last_modified"]  # Ask the server to answer 304 if unchanged
+
+    return headers  # Return the conditional headers
+
+
+def get_cached_scrape(url):
+    """
+    Returns the proxies scraped from a URL within the last SCRAPE_CACHE_TTL seconds.
+
+    :param url: The URL of the proxy source
+    :return: List of proxy strings if a fresh entry exists, None otherwise
+    """
+
+    entry = SCRAPE_CACHE.get(url)  # Timestamp and proxies of the last scrape of this URL
+
+    if entry and time.monotonic() - entry[0] < SCRAPE_CACHE_TTL:  # Entry exists and has not expired
+        return entry[1]  # Return the cached proxies
+
+    return None  # No fresh entry for this URL
+
+
+def cache_scrape(url, proxies):
+    """
+    Stores the proxies scraped from a URL in the in-process scrape cache.
+
+    :param url: The URL of the proxy source
+    :param proxies: List of proxy strings scraped from the URL
+    :return: The same list of proxy strings
+    """
+
+    SCRAPE_CACHE[url] = (time.monotonic(), proxies)  # Remember when the URL was scraped
+
+    return proxies  # Return the proxies so callers can cache and return in one step
+
+
+def clear_scrape_cache():
+    """
+    Clears the in-process scrape cache, forcing the next scrape of every URL
+    to hit the network.
+
+    :param: None
+    :return: None
+    """
+
+    SCRAPE_CACHE.clear()  # Drop every cached entry
+
+
+def pack_proxy(proxy):
+    """
+    Validates a proxy string and packs it into a single integer, with the IPv4
+    address in the high 32 bits and the port in the low 16 bits, so proxies
+    can be compared with integer operations.
+
+    :param proxy: Proxy string in IP:PORT format
+    :return: Tuple (packed integer key, canonical proxy string), or None if the proxy is invalid
+    """
+
+    ip, _, port = proxy.partition(":")  # Split into IP and port components
+
+    if not 0 < len(port) <= 5 or port.strip("0123456789"):  # Port must be a short run of ASCII digits
+        return None  # Invalid port
+
+    port_number = int(port)  # Convert the port to an integer
+    if not 0 < port_number < 65536:  # Port must fit in 16 bits and not be zero
+        return None  # Invalid port
+
+    try:  # Strict dotted-decimal IPv4 validation (each octet < 256)
+        packed_ip = socket.inet_pton(socket.AF_INET, ip)  # Four network-order bytes of the address
+    except (OSError, ValueError):  # Malformed address or octet overflow
+        return None  # Invalid IP
+
+    key = (int.from_bytes(packed_ip, "big") << 16) | port_number  # Pack IP and port into one integer
+
+    return key, f"{ip}:{port_number}"  # Return the key and the canonical proxy string
+
+
+def normalize_proxies(proxies):
+    """
+    Drops invalid and duplicate proxies and sorts the remaining ones
+    numerically by IP address and port (so 2.x comes before 10.x).
+
+    :param proxies: List of proxy strings in IP:PORT format
+    :return: Sorted list of unique, valid proxy strings
+    """
+
+    unique = {}  # Canonical proxy strings keyed by their packed integer
+
+    for proxy in proxies:  # Validate and pack each proxy
+        packed = pack_proxy(proxy)  # Packed key and canonical string, or None
+        if packed is not None:  # Skip invalid proxies
+            unique.setdefault(packed[0], packed[1])  # Keep the first occurrence of each proxy
+
+    return [unique[key] for key in sorted(unique)]  # Integer sort is numeric by IP, then port
+
+
+def parse_proxy_page(source_key, response):
+    """
+    Dispatches a fetched page to the parser that matches its source format.
+
+    spys.me exposes a plain-text list (regex-based), free-proxy-list.net uses
+    a custom HTML layout, and all other sources use a standard HTML table.
+
+    :param source_key: Key in PROXY_SOURCES dict identifying the site
+    :param response: Response object returned by fetch_proxy_page
+    :return: List of proxy strings in IP:PORT format
+    """
+
+    if source_key == "spys_me":  # spys.me uses a different format (regex-based)
+        return extract_proxies_from_spys_me(response.iter_content(chunk_size=STREAM_CHUNK_SIZE))  # Scan the body while streaming
+    if source_key == "free_proxy_list":  # free-proxy-list.net uses a different format (custom HTML parsing)
+        return extract_proxies_from_free_proxy_list(response.content)  # Extract proxies using the custom parser
+    return extract_proxies_from_table(response.content)  # Other sites use standard HTML table format
+
+
+def scrape_proxies_from_source(source_key, http_cache, force=False):
+    """
+    Scrapes a single proxy source.
 
     This function orchestrates the proxy scraping workflow by validating the URL,
-    fetching the page content, and extracting proxy data from HTML tables.
+    fetching the page content, and handing the body to the matching parser.
+    URLs scraped less than SCRAPE_CACHE_TTL seconds ago are served from memory
+    without any request. Otherwise, when the URL is in the HTTP cache, a conditional
+    request is issued and a 304 Not Modified answer reuses the cached proxies
+    without downloading or parsing the page.
     It is intentionally defensive and always returns a list (possibly empty)
-    rather than raising on network or parsing errors.
+    rather than raising on network or parsing errors, so it can safely run
+    inside a worker thread.
 
-    :param url_name: Key in PROXY_SOURCES dict identifying the site
+    :param source_key: Key in PROXY_SOURCES dict identifying the site
+    :param http_cache: Dictionary mapping URLs to cache entries (updated in place)
+    :param force: If True, ignore both caches and download the page again
     :return: List of proxy strings in IP:PORT format
     """
 
-    url = validate_proxy_source_url(url_name)  # Validate and retrieve the URL
+    url = validate_proxy_source_url(source_key)  # Validate and retrieve the URL
     
     if not url:  # URL validation failed
         return []  # Return empty list when no URL is configured
 
-    response = fetch_proxy_page(url)  # Fetch the HTML content from the URL
+    cached_proxies = None if force else get_cached_scrape(url)  # Proxies scraped from this URL moments ago
+    
+    if cached_proxies is not None:  # Fresh in-process cache hit
+        return cached_proxies  # Reuse the proxies without any request
+
+    cache_entry = None if force else http_cache.get(url)  # Cached validators and proxies for this URL
+    response = fetch_proxy_page(url, headers=build_conditional_headers(cache_entry))  # Fetch the page content from the URL
     
     if not response:  # Fetch failed
         return []  # Return empty list on request failure
 
-    proxies = extract_proxies_from_table(response.content)  # Extract proxies from the HTML table
+    if response.status_code == 304:  # Page unchanged since the cached response
+        response.close()  # Release the connection, a 304 answer has no body
+        if not cache_entry:  # The server answered 304 to an unconditional request
+            return []  # Return empty list as there is nothing to reuse
+        etag = response.headers.get("ETag")  # A 304 may carry a refreshed entity tag
+        last_modified = response.headers.get("Last-Modified")  # A 304 may carry a refreshed modification date
+        if etag:  # Keep the newest entity tag for the next revalidation
+            cache_entry["etag"] = etag  # Update the cached entry in place
+        if last_modified:  # Keep the newest modification date for the next revalidation
+            cache_entry["last_modified"] = last_modified  # Update the cached entry in place
+        if VERBOSE:  # Only build the message when verbose output is enabled
+            print(NOT_MODIFIED_TEMPLATE.format(count=len(cache_entry["proxies"]), url=url))  # Output the cache hit message
+        return cache_scrape(url, cache_entry["proxies"])  # Reuse the cached proxies without parsing
+
+    try:  # Parsing must never break the other sources running concurrently
+        proxies = parse_proxy_page(source_key, response)  # Extract proxies with the source-specific parser
+        proxies = normalize_proxies(proxies)  # Drop invalid and duplicate proxies and sort them numerically
+    except Exception as exc:  # Unexpected page layout or malformed content
+        if VERBOSE:  # Only build the message when verbose output is enabled
+            print(PARSE_FAILED_TEMPLATE.format(url=url, error=exc))  # Output error message
+        return []  # Return empty list on parsing failure
+    finally:  # Parsers consume the streamed body
+        response.close()  # Release the connection back to the pool
+
+    etag = response.headers.get("ETag")  # Entity tag validator of this response
+    last_modified = response.headers.get("Last-Modified")  # Last modification date validator of this response
+    if etag or last_modified:  # Only cache responses that can be revalidated
+        http_cache[url] = {"etag": etag, "last_modified": last_modified, "proxies": proxies}  # Store validators and proxies
+
+    if VERBOSE:  # Only build the message when verbose output is enabled
+        print(SCRAPED_TEMPLATE.format(count=len(proxies), url=url))  # Output the scraping result
+
+    return cache_scrape(url, proxies)  # Remember and return the list of proxies
+
+
+def scrape_and_write_proxy_source(source_key, http_cache, force=False):
+    """
+    Scrapes a single proxy source and immediately writes its proxy file.
 
-    verbose_output(
-        f"{BackgroundColors.GREEN}Scraped {len(proxies)} proxies from {url}{Style.RESET_ALL}"
-    )  # Output the scraping result
+    Running both stages in the same worker lets a source that finished early
+    be parsed and saved while the slower sources are still downloading.
 
-    return proxies  # Return the list of proxies
+    :param source_key: Key in PROXY_SOURCES dict identifying the site
+    :param http_cache: Dictionary mapping URLs to cache entries (updated in place)
+    :param force: If True, ignore both caches and download the page again
+    :return: List of proxy strings in IP:PORT format
+    """
 
+    proxies = scrape_proxies_from_source(source_key, http_cache, force)  # Fetch and parse the source
 
-def collect_proxies_from_all_sources():
-    """
-    Collects proxies from all configured sources by dynamically dispatching
-    to the appropriate scraper function for each source.
+    if proxies:  # Only write if the proxy list is not empty
+        try:  # A failed write must never break the other sources running concurrently
+            write_proxy_file(source_key, proxies)  # Save the proxies of this source right away
+        except OSError as exc:  # Permission denied, disk full, etc.
+            print(WRITE_FAILED_TEMPLATE.format(source=source_key, error=exc))  # Output error message
+
+    return proxies  # Return the list of proxies
 
-    This function iterates over all keys in PROXY_SOURCES in sorted order,
-    dispatching to specialized scrapers for spys.me and free-proxy-list.net,
-    and using the generic table scraper for all other sources.
 
+def collect_proxies_from_all_sources(force=False):
+    """
+    Collects proxies from all configured sources concurrently and writes
+    the proxy file of each source as soon as it has been scraped.
+
+    Scraping is dominated by independent network round-trips, so each source
+    is submitted to a thread pool (the GIL is released while waiting on the
+    socket) and total wall time becomes roughly that of the slowest source
+    instead of the sum of all of them. The number of workers is bounded by
+    MAX_CONCURRENT_REQUESTS so the fan-out stays safe as sources are added.
+    The HTTP cache is loaded before and saved after scraping so unchanged
+    pages are revalidated on the next run.
+
+    :param force: If True, ignore the HTTP cache and download every page again
     :return: Dictionary mapping source keys to lists of proxy strings
     """
 
-    proxies_dict = {}  # Dictionary to hold proxies from each source
-    
-    for source_key in sorted(PROXY_SOURCES.keys()):  # Iterate over each proxy source in alphabetical order
-        if source_key == "spys_me":  # spys.me uses a different format (regex-based)
-            proxies = scrape_proxies_from_spys_me()  # Scrape proxies from spys.me using regex
-        elif source_key == "free_proxy_list":  # free-proxy-list.net uses a different format (custom HTML parsing)
-            proxies = scrape_proxies_from_free_proxy_list()  # Scrape proxies from free-proxy-list.net using custom parser
-        else:  # Other sites use standard HTML table format
-            proxies = scrape_proxies_from_table_site(source_key)  # Scrape proxies using the generic table scraper
+    http_cache = load_http_cache()  # Load the validators and proxies of the previous run
+
+    create_directory(OUTPUT_DIR)  # Create the output directory before the workers write to it
+
+    max_workers = min(len(PROXY_SOURCES), MAX_CONCURRENT_REQUESTS)  # One worker per source, bounded as sources grow
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:  # Fan out all sources in a single pass
+        futures = {
+            executor.submit(scrape_and_write_proxy_source, source_key, http_cache, force): source_key
+            for source_key in PROXY_SOURCES
+        }  # Submit one scrape task per source
+
+        proxies_dict = {futures[future]: future.result() for future in as_completed(futures)}  # Collect results as they finish
+
+    proxies_dict = dict(sorted(proxies_dict.items()))  # Restore alphabetical order regardless of completion order
 
-        proxies_dict[source_key] = proxies  # Store results under the source key
+    save_http_cache(http_cache)  # Persist the validators for the next run
     
     return proxies_dict  # Return the dictionary containing all collected proxies
 
@@ -337,41 +645,44 @@ def create_directory(directory):
     """
     Creates a directory if it does not already exist.
 
+    The directory is created directly and an existing one is detected from the
+    FileExistsError, which avoids a separate existence check (one less stat
+    syscall and no check-then-create race).
+
     :param directory: The path of the directory to create
     :return: None
     """
 
-    if not verify_filepath_exists(directory):  # Check if the directory already exists
+    try:  # Attempt to create the directory
         os.makedirs(directory)  # Create the directory
         verbose_output(
             f"{BackgroundColors.GREEN}Created directory: {BackgroundColors.CYAN}{directory}{Style.RESET_ALL}"
         )  # Output the directory creation message
-    else:  # If the directory already exists
+    except FileExistsError:  # If the directory already exists
         verbose_output(
             f"{BackgroundColors.YELLOW}Directory already exists: {BackgroundColors.CYAN}{directory}{Style.RESET_ALL}"
         )  # Output the directory already exists message
 
 
-def write_proxy_files(proxies_dict):
+def write_proxy_file(website, proxies):
     """
-    Writes proxy lists to files for sources that have non-empty proxy lists.
+    Writes the proxy list of a single source to its file in OUTPUT_DIR.
 
-    :param proxies_dict: Dictionary with website names as keys and proxy lists as values
+    The list is joined into a single bytes buffer and written with one
+    open/write/close, instead of one buffered print per proxy.
+
+    :param website: Source key used to name the file
+    :param proxies: Non-empty list of proxy strings for this source
     :return: None
     """
 
-    for website, proxies in proxies_dict.items():  # Iterate over each website's proxies
-        if proxies:  # Only write if the proxy list is not empty
-            filename = f"{website}_{OUTPUT_FILE_SUFFIX}"  # Create filename based on website name
-            filepath = os.path.join(OUTPUT_DIR, filename)  # Full path to the file
-            
-            with open(filepath, "w") as file:  # Open file in write mode
-                for proxy in proxies:  # Write each proxy to the file
-                    print(proxy, file=file)
-            
-            verbose_output(
-                f"{BackgroundColors.GREEN}Wrote {len(proxies)} proxies to {filepath}{Style.RESET_ALL}"
-            )  # Output file write confirmation
+    filepath = OUTPUT_DIR_PATH / f"{website}_{OUTPUT_FILE_SUFFIX}"  # Full path to the file based on website name
+    
+    data = ("\n".join(proxies) + "\n").encode("utf-8")  # One proxy per line in a single contiguous buffer
+    filepath.write_bytes(data)  # Binary write skips the text I/O layer and keeps "\n" line endings on Windows
+    
+    if VERBOSE:  # Only build the message when verbose output is enabled
+        print(WROTE_TEMPLATE.format(count=len(proxies), filepath=filepath))  # Output file write confirmation
 
 
 def format_source_display_name(source_key):
@@ -436,6 +747,23 @@ def write_markdown_table_of_contents(md_file, proxies_dict):
     md_file.write("\n---\n\n")  # Write separator after TOC
 
 
+def format_markdown_proxy_row(idx, proxy):
+    """
+    Formats a single proxy as a row of the markdown proxy table.
+    
+    :param idx: Position of the proxy in its source list (starting from 1)
+    :param proxy: Proxy string in IP:PORT format
+    :return: Markdown table row, or an empty string if the proxy is not in IP:PORT format
+    """
+    
+    if ":" not in proxy:  # Ensure proxy has IP:PORT format
+        return ""  # Skip malformed proxies
+    
+    ip, port = proxy.split(":", 1)  # Split into IP and port components
+    
+    return f"| {idx} | `{ip}` | `{port}` | `{proxy}` |\n"  # Table row with proxy data
+
+
 def write_markdown_proxy_section(md_file, source_key, proxies):
     """
     Writes a single proxy source section with expandable table.
@@ -460,10 +788,9 @@ def write_markdown_proxy_section(md_file, source_key, proxies):
     md_file.write("| # | IP Address | Port | Full Proxy |\n")  # Write table column headers
     md_file.write("|---|------------|------|------------|\n")  # Write table header separator
     
-    for idx, proxy in enumerate(proxies, 1):  # Enumerate proxies starting from 1
-        if ":" in proxy:  # Ensure proxy has IP:PORT format
-            ip, port = proxy.split(":", 1)  # Split into IP and port components
-            md_file.write(f"| {idx} | `{ip}` | `{port}` | `{proxy}` |\n")  # Write table row with proxy data
+    md_file.write(
+        "".join(format_markdown_proxy_row(idx, proxy) for idx, proxy in enumerate(proxies, 1))
+    )  # Write every table row with a single call instead of one write per proxy
     
     md_file.write("\n</details>\n\n")  # Close details tag
     md_file.write("---\n\n")  # Write separator after section
@@ -555,6 +882,9 @@ def calculate_execution_time(start_time, finish_time=None):
     - A single timedelta or numeric seconds: `calculate_execution_time(delta)`
     - Two numeric timestamps (seconds): `calculate_execution_time(start_s, finish_s)`
 
+    main() measures its own run with time.perf_counter() and calls format_duration()
+    directly; this function only converts the inputs to seconds for external callers.
+
     Returns a string like "1h 2m 3s".
     """
 
@@ -582,13 +912,24 @@ def calculate_execution_time(start_time, finish_time=None):
 
     if total_seconds is None:  # Ensure a numeric value
         total_seconds = 0.0  # Default to zero
+
+    return format_duration(total_seconds)  # Format the duration as a human-readable string
+
+
+def format_duration(total_seconds):
+    """
+    Formats a duration in seconds as a human-readable string like "1h 2m 3s".
+
+    :param total_seconds: The duration in seconds (int or float)
+    :return: The formatted duration string
+    """
+
     if total_seconds < 0:  # Normalize negative durations
         total_seconds = abs(total_seconds)  # Use absolute value
 
-    days = int(total_seconds // 86400)  # Compute full days
-    hours = int((total_seconds % 86400) // 3600)  # Compute remaining hours
-    minutes = int((total_seconds % 3600) // 60)  # Compute remaining minutes
-    seconds = int(total_seconds % 60)  # Compute remaining seconds
+    minutes, seconds = divmod(int(total_seconds), 60)  # Compute full minutes and remaining seconds
+    hours, minutes = divmod(minutes, 60)  # Compute full hours and remaining minutes
+    days, hours = divmod(hours, 24)  # Compute full days and remaining hours
 
     if days > 0:  # Include days when present
         return f"{days}d {hours}h {minutes}m {seconds}s"  # Return formatted days+hours+minutes+seconds
@@ -607,16 +948,25 @@ def play_sound():
     :return: None
     """
 
-    current_os = platform.system()  # Get the current operating system
-    if current_os == "Windows":  # If the current operating system is Windows
+    if CURRENT_OS == "Windows":  # If the current operating system is Windows
         return  # Do nothing
 
-    if verify_filepath_exists(SOUND_FILE):  # If the sound file exists
-        if current_os in SOUND_COMMANDS:  # If the platform.system() is in the SOUND_COMMANDS dictionary
-            os.system(f"{SOUND_COMMANDS[current_os]} {SOUND_FILE}")  # Play the sound
+    if SOUND_FILE_EXISTS:  # If the sound file exists
+        if SOUND_COMMAND is not None:  # If the platform.system() is in the SOUND_COMMANDS dictionary
+            try:  # The sound player may not be installed (e.g. aplay on minimal Linux hosts)
+                subprocess.Popen(
+                    [SOUND_COMMAND, SOUND_FILE],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )  # Play the sound in the background without spawning a shell or blocking the program exit
+            except OSError as exc:  # Missing or non-executable sound player
+                print(
+                    f"{BackgroundColors.RED}Could not run the {BackgroundColors.CYAN}{SOUND_COMMAND}{BackgroundColors.RED} command to play the sound: {exc}{Style.RESET_ALL}"
+                )
         else:  # If the platform.system() is not in the SOUND_COMMANDS dictionary
             print(
-                f"{BackgroundColors.RED}The {BackgroundColors.CYAN}{current_os}{BackgroundColors.RED} is not in the {BackgroundColors.CYAN}SOUND_COMMANDS dictionary{BackgroundColors.RED}. Please add it!{Style.RESET_ALL}"
+                f"{BackgroundColors.RED}The {BackgroundColors.CYAN}{CURRENT_OS}{BackgroundColors.RED} is not in the {BackgroundColors.CYAN}SOUND_COMMANDS dictionary{BackgroundColors.RED}. Please add it!{Style.RESET_ALL}"
             )
     else:  # If the sound file does not exist
         print(
@@ -624,6 +974,26 @@ def play_sound():
         )
 
 
+def parse_arguments():
+    """
+    Parses the command-line arguments.
+
+    :param: None
+    :return: Namespace with the parsed arguments
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Generates proxy lists by scraping free online proxy sources."
+    )  # Create the argument parser
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore the HTTP and in-process caches and download every proxy source again",
+    )  # Force a full re-scrape instead of conditional requests
+
+    return parser.parse_args()  # Parse and return the command-line arguments
+
+
 def main():
     """
     Main function.
@@ -632,36 +1002,31 @@ def main():
     :return: None
     """
 
-    print(
-        f"{BackgroundColors.CLEAR_TERMINAL}{BackgroundColors.BOLD}{BackgroundColors.GREEN}Welcome to the {BackgroundColors.CYAN}Proxy List Generator{BackgroundColors.GREEN} program!{Style.RESET_ALL}",
-        end="\n\n",
-    )  # Output the welcome message
+    args = parse_arguments()  # Parse the command-line arguments before clearing the terminal, so --help and errors stay readable
+    print(WELCOME_MESSAGE, end="\n\n")  # Output the welcome message
     start_time = datetime.datetime.now()  # Get the start time of the program
+    start_counter = time.perf_counter()  # Start the monotonic high-resolution clock for the execution time
     
-    proxies_dict = collect_proxies_from_all_sources()  # Collect proxies from all configured sources
+    proxies_dict = collect_proxies_from_all_sources(force=args.force)  # Collect and save proxies from all configured sources
     
     if not any(proxies_dict.values()):  # Verify if all proxy lists are empty
+        print(NO_PROXIES_MESSAGE)  # Output a warning message if no proxies were scraped
+    else:  # At least one source returned proxies
+        generate_markdown_proxy_list(proxies_dict)  # Generate markdown file with proxy list
+
+        finish_time = datetime.datetime.now()  # Get the finish time of the program
+        elapsed_seconds = time.perf_counter() - start_counter  # Execution time, immune to wall-clock adjustments
         print(
-            f"{BackgroundColors.YELLOW}No proxies were scraped from any source. Skipping output file creation.{Style.RESET_ALL}"
-        )  # Output a warning message if no proxies were scraped
-        return  # Exit the main function early since there's nothing to save
-    
-    create_directory(OUTPUT_DIR)  # Create the output directory if it doesn't exist
-    
-    write_proxy_files(proxies_dict)  # Write proxy files for non-empty lists
-    
-    generate_markdown_proxy_list(proxies_dict)  # Generate markdown file with proxy list
-
-    finish_time = datetime.datetime.now()  # Get the finish time of the program
-    print(
-        f"{BackgroundColors.GREEN}Start time: {BackgroundColors.CYAN}{start_time.strftime('%d/%m/%Y - %H:%M:%S')}\n{BackgroundColors.GREEN}Finish time: {BackgroundColors.CYAN}{finish_time.strftime('%d/%m/%Y - %H:%M:%S')}\n{BackgroundColors.GREEN}Execution time: {BackgroundColors.CYAN}{calculate_execution_time(start_time, finish_time)}{Style.RESET_ALL}"
-    )  # Output the start and finish times
-    print(
-        f"\n{BackgroundColors.BOLD}{BackgroundColors.GREEN}Program finished.{Style.RESET_ALL}"
-    )  # Output the end of the program message
-    (
-        atexit.register(play_sound) if RUN_FUNCTIONS["Play Sound"] else None
-    )  # Register the play_sound function to be called when the program finishes
+            EXECUTION_TIMES_TEMPLATE.format(
+                start=start_time.strftime("%d/%m/%Y - %H:%M:%S"),
+                finish=finish_time.strftime("%d/%m/%Y - %H:%M:%S"),
+                elapsed=format_duration(elapsed_seconds),
+            )
+        )  # Output the start and finish times
+        print(PROGRAM_FINISHED_MESSAGE)  # Output the end of the program message
+
+    if RUN_FUNCTIONS["Play Sound"]:  # Play the sound on every completed run, including the no-proxies path
+        play_sound()  # Start the sound in the background (it does not block the program exit)
 
 
 if __name__ == "__main__":